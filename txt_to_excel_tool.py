@@ -6,65 +6,151 @@
 """
 from __future__ import annotations
 
-import argparse
+import importlib.util
+import io
+import itertools
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
-try:
-    import tkinter as tk
-    from tkinter import filedialog, messagebox, ttk
-except Exception:  # pragma: no cover - 在无图形环境下运行时跳过
-    tk = None
-    filedialog = messagebox = ttk = None  # type: ignore
-
-try:
-    from openpyxl import load_workbook
-except ModuleNotFoundError:  # pragma: no cover - 延迟到运行时报错
-    load_workbook = None  # type: ignore
+from templates import DEFAULT_TEMPLATE_SHEET_PART, default_template_bytes, is_default_template
 
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    import argparse
 
 CHINESE_COMMA = "，"
+# 读取 TXT 时使用 1 MiB 缓冲区，大文件可显著减少 read 调用次数
+TXT_READ_BUFFER_SIZE = 1 << 20
+DEFAULT_START_ROW = 2
+
+# XML 1.0 不允许出现的控制字符（与 openpyxl 拒绝写入的字符范围一致），在整理文案时统一删除
+_ILLEGAL_CONTROL_CHARS = dict.fromkeys(code for code in range(0x20) if code not in (0x09, 0x0A, 0x0D))
+# 直接生成工作表 XML 时使用的转义表
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
 
-def extract_units(lines: Iterable[str]) -> list[str]:
-    """根据需求文档的规则将原始行列表整理成文案单元列表。
+def iter_units(lines: Iterable[str]) -> Iterator[str]:
+    """根据需求文档的规则将原始行逐个整理成文案单元。
 
     - 文案中的换行需要替换成中文逗号进行连接；
     - 遇到空行时视为一个文案单元结束；
-    - 连续空行会被忽略，只作为一次分隔处理。
+    - 连续空行会被忽略，只作为一次分隔处理；
+    - Excel 无法保存的控制字符会被删除。
+
+    以生成器形式逐个产出，调用方无需先把全部文案单元保存在内存中。
     """
 
-    units: list[str] = []
-    current: list[str] = []
+    parts = io.StringIO()
+    has_content = False
 
     for raw_line in lines:
-        # 使用 rstrip 去掉末尾的换行符，同时保留中间的空格和中文字符
-        line = raw_line.rstrip("\n\r").replace("\ufeff", "")
-        if line.strip() == "":
-            if current:
-                units.append(CHINESE_COMMA.join(current))
-                current = []
+        # strip 一次性去掉首尾空白与换行符，同时保留中间的空格和中文字符
+        line = raw_line.strip()
+        if "\ufeff" in line:
+            # 拼接多个带 BOM 的文件时 BOM 会出现在文件中间，与原先一样整体删除
+            line = line.replace("\ufeff", "").strip()
+
+        if not line:
+            if has_content:
+                yield parts.getvalue().translate(_ILLEGAL_CONTROL_CHARS)
+                parts = io.StringIO()
+                has_content = False
             continue
 
-        current.append(line.strip())
+        if has_content:
+            parts.write(CHINESE_COMMA)
+        parts.write(line)
+        has_content = True
 
-    if current:
-        units.append(CHINESE_COMMA.join(current))
+    if has_content:
+        yield parts.getvalue().translate(_ILLEGAL_CONTROL_CHARS)
 
-    return units
 
+def _fast_write_default_template(units: Iterable[str], output_path: Path, *, start_row: int) -> int:
+    """基于内置空白模板直接生成结果文件。
 
-def convert_txt_to_excel(txt_path: Path, template_path: Path, *, start_row: int = 2) -> int:
-    """将 TXT 文案转换并写入 Excel。
-
-    返回写入的文案单元数量。
+    除工作表 XML 外的条目原样复制，只重新生成 sheetData，
+    省去 openpyxl 对整个工作簿的解析与重新序列化。
+    若内置模板的工作表中找不到空的 ``<sheetData/>``，则退回 :func:`_fill_template`。
     """
 
-    if load_workbook is None:
+    # zipfile 只在此快速路径中使用，延迟导入以免拖慢其他启动场景
+    import zipfile
+
+    with zipfile.ZipFile(io.BytesIO(default_template_bytes())) as source:
+        sheet_xml = source.read(DEFAULT_TEMPLATE_SHEET_PART).decode("utf-8")
+        head, marker, tail = sheet_xml.partition("<sheetData/>")
+        if not marker:
+            return _fill_template(units, output_path, start_row=start_row)
+
+        # 逐段追加到同一个列表并在最后一次性拼接，避免每行生成临时字符串
+        parts: list[str] = [head, "<sheetData>"]
+        append = parts.append
+        count = 0
+        for row_index, unit in enumerate(units, start=start_row):
+            row = str(row_index)
+            append('<row r="')
+            append(row)
+            append('"><c r="A')
+            append(row)
+            append('" t="inlineStr"><is><t xml:space="preserve">')
+            append(unit.translate(_XML_ESCAPE))
+            append("</t></is></c></row>")
+            count += 1
+        append("</sheetData>")
+        append(tail)
+        sheet_bytes = "".join(parts).encode("utf-8")
+
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                if info.filename == DEFAULT_TEMPLATE_SHEET_PART:
+                    target.writestr(info, sheet_bytes)
+                else:
+                    target.writestr(info, source.read(info))
+
+    return count
+
+
+def _fill_template(units: Iterable[str], template_path: Path, *, start_row: int) -> int:
+    """载入自定义模板，只写入第一列，其余内容与格式保持不变。"""
+
+    # openpyxl 导入开销较大，仅在确实需要载入模板时才加载
+    try:
+        from openpyxl import load_workbook
+    except ModuleNotFoundError as exc:  # pragma: no cover - 依赖缺失时给出提示
         raise ModuleNotFoundError(
             "openpyxl 未安装，请先运行 `pip install openpyxl` 后再执行转换。"
-        )
+        ) from exc
+
+    workbook = load_workbook(template_path)
+    sheet = workbook.active
+
+    count = 0
+    if sheet.max_row < start_row:
+        # 写入区域尚无内容：占位到 start_row - 1 后直接按行追加，省去逐格定位
+        if start_row > 1:
+            sheet.cell(row=start_row - 1, column=1)
+        for unit in units:
+            sheet.append((unit,))
+            count += 1
+    else:
+        # 模板在写入区域已有内容时逐格覆盖第一列，其余列保持不变
+        for row_index, unit in enumerate(units, start=start_row):
+            sheet.cell(row=row_index, column=1, value=unit)
+            count += 1
+
+    workbook.save(template_path)
+    return count
+
+
+def convert_txt_to_excel(txt_path: Path, template_path: Path, *, start_row: int = DEFAULT_START_ROW) -> int:
+    """将 TXT 文案转换并写入 Excel。
+
+    模板与内置空白模板一致时直接拼装结果文件，否则完整载入模板后写入。
+    返回写入的文案单元数量。
+    """
 
     if not txt_path.is_file():
         raise FileNotFoundError(f"未找到 TXT 文件：{txt_path}")
@@ -72,25 +158,25 @@ def convert_txt_to_excel(txt_path: Path, template_path: Path, *, start_row: int
     if not template_path.is_file():
         raise FileNotFoundError(f"未找到 Excel 模板：{template_path}")
 
-    with txt_path.open("r", encoding="utf-8") as fh:
-        units = extract_units(fh.readlines())
-
-    workbook = load_workbook(template_path)
-    sheet = workbook.active
-
     if start_row < 1:
         raise ValueError("start_row 必须从 1 开始。")
 
-    row_index = start_row
-    for unit in units:
-        sheet.cell(row=row_index, column=1).value = unit
-        row_index += 1
+    # utf-8-sig 由解码器去除文件开头的 BOM；
+    # newline="" 保留原始换行符，交由 iter_units 中的 strip 统一去除
+    with txt_path.open("r", encoding="utf-8-sig", buffering=TXT_READ_BUFFER_SIZE, newline="") as fh:
+        units = iter_units(fh)
+        first_unit = next(units, None)
+        if first_unit is None:
+            # 没有任何文案时结果与模板完全相同，直接跳过整个写入流程
+            return 0
+        units = itertools.chain((first_unit,), units)
 
-    workbook.save(template_path)
-    return len(units)
+        if is_default_template(template_path):
+            return _fast_write_default_template(units, template_path, start_row=start_row)
+        return _fill_template(units, template_path, start_row=start_row)
 
 
-def run_cli(args: argparse.Namespace) -> None:
+def run_cli(args: argparse.Namespace | SimpleNamespace) -> None:
     txt_path = Path(args.txt)
     template_path = Path(args.template)
 
@@ -98,9 +184,22 @@ def run_cli(args: argparse.Namespace) -> None:
     print(f"已写入 {count} 条文案到 {template_path}。")
 
 
+def _tkinter_available() -> bool:
+    """在不真正导入 tkinter 的前提下判断当前环境是否支持图形界面。
+
+    部分精简环境只带有纯 Python 的 tkinter 包而缺少 _tkinter 扩展，因此探测后者。
+    """
+
+    return importlib.util.find_spec("_tkinter") is not None
+
+
 def run_gui() -> None:  # pragma: no cover - GUI 难以自动化测试
-    if tk is None:
-        raise SystemExit("当前环境不支持 Tkinter 图形界面，请改用命令行参数运行。")
+    # 仅在真正启动界面时才导入 tkinter，命令行模式无需承担其导入开销
+    try:
+        import tkinter as tk
+        from tkinter import filedialog, messagebox, ttk
+    except Exception as exc:  # 在无图形环境下运行时给出友好提示
+        raise SystemExit("当前环境不支持 Tkinter 图形界面，请改用命令行参数运行。") from exc
 
     root = tk.Tk()
     root.title("TXT 文案转 Excel 工具")
@@ -183,13 +282,48 @@ def run_gui() -> None:  # pragma: no cover - GUI 难以自动化测试
     root.mainloop()
 
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
+def _fast_parse_args(argv: list[str]) -> Optional[SimpleNamespace]:
+    """不经过 argparse 直接解析最常见的调用形式。
+
+    仅识别无参数（启动图形界面）以及 ``--txt X --template Y``（顺序不限）两种情况，
+    其余情况（含 ``--help``、``--start-row`` 等）返回 ``None``，交由 :func:`parse_args` 处理。
+    """
+
+    if not argv:
+        if not _tkinter_available():
+            return None
+        return SimpleNamespace(txt=None, template=None, start_row=DEFAULT_START_ROW, gui=True)
+
+    if len(argv) != 4:
+        return None
+
+    options = {argv[0]: argv[1], argv[2]: argv[3]}
+    if options.keys() != {"--txt", "--template"}:
+        return None
+
+    txt, template = options["--txt"], options["--template"]
+    if not txt or not template or txt.startswith("-") or template.startswith("-"):
+        return None
+
+    return SimpleNamespace(txt=txt, template=template, start_row=DEFAULT_START_ROW, gui=False)
+
+
+@lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """构建命令行解析器；解析器不依赖运行时状态，构建一次即可重复使用。"""
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="TXT 文案转 Excel 工具")
     parser.add_argument("--txt", help="需要转换的 TXT 文件路径")
     parser.add_argument("--template", help="Excel 模板路径", default=None)
-    parser.add_argument("--start-row", type=int, default=2, help="在 Excel 中写入的起始行，默认为 2")
+    parser.add_argument("--start-row", type=int, default=DEFAULT_START_ROW, help="在 Excel 中写入的起始行，默认为 2")
     parser.add_argument("--gui", action="store_true", help="强制启动图形界面")
+    return parser
 
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
     provided_cli = any(value is not None for value in (args.txt, args.template)) or (
@@ -197,6 +331,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     )
 
     if args.gui or not provided_cli:
+        if not args.gui and not _tkinter_available():
+            parser.error("当前环境不支持 Tkinter 图形界面，请提供 --txt 与 --template 参数。")
         args.gui = True
         return args
 
@@ -207,7 +343,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 
 
 def main(argv: Optional[list[str]] = None) -> None:
-    args = parse_args(argv or sys.argv[1:])
+    argv = argv or sys.argv[1:]
+    args = _fast_parse_args(argv) or parse_args(argv)
     if args.gui:
         run_gui()
     else: